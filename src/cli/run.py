@@ -9,7 +9,7 @@ from services.database import Database
 from services.vector_store import VectorStore
 from services.digest_tracker import DigestTracker
 from services.llm import OllamaClient
-from workflows.pipeline_factory import create_pipelines_from_config
+from workflows.pipeline_factory import create_pipelines_from_config, run_all
 from delivery.file_delivery import FileDelivery
 from delivery.telegram_delivery import TelegramDelivery
 from delivery.base import DeliveryChannel
@@ -40,69 +40,70 @@ async def main() -> None:
             "Ollama is not reachable. Please ensure ollama serve is running, base URL is correct, and the model is pulled. "
             f"Configured base_url={config.OLLAMA_BASE_URL}, model={config.OLLAMA_MODEL}"
         )
+        await llm.aclose()
         return
 
     db = Database(config.DATABASE_PATH)
     vector_store = VectorStore(config.FAISS_INDEX_PATH)
     tracker = DigestTracker(db, vector_store)
 
-    # ----------------------------
-    # Create pipelines from config
-    # ----------------------------
-    if config.pipelines:
-        # Use new modular pipeline configuration
-        pipelines = create_pipelines_from_config(
-            pipelines_config=config.pipelines,
-            llm=llm,
-            tracker=tracker,
-        )
-        logger.info(f"Created {len(pipelines)} pipelines from config")
-    else:
-        # Fallback to legacy pipeline configuration
-        logger.warning("No pipelines configured, using legacy configuration")
-        from workflows.genai_news import GenAINewsPipeline
-        from workflows.product_ideas import ProductIdeasPipeline
-
-        pipelines = []
-        if config.PERSONA_GENAI_NEWS_ENABLED:
-            pipelines.append(GenAINewsPipeline(llm=llm, tracker=tracker))
-        if config.PERSONA_PRODUCT_IDEAS_ENABLED:
-            pipelines.append(ProductIdeasPipeline(llm=llm, tracker=tracker))
-
-    # ----------------------------
-    # Initialize delivery channels
-    # ----------------------------
-    deliveries = list[DeliveryChannel]([FileDelivery()])
-
-    if config.EMAIL_ENABLED:
-        deliveries.append(
-            HybridEmailDelivery(
-                smtp_host=config.EMAIL_SMTP_HOST,
-                smtp_port=config.EMAIL_SMTP_PORT,
-                username=config.EMAIL_USERNAME,
-                password=config.EMAIL_PASSWORD,
-                sender=config.EMAIL_FROM,
-                legacy_recipient=config.EMAIL_TO,
-                colors=config.email_colors.model_dump(),
+    try:
+        # ----------------------------
+        # Create pipelines from config
+        # ----------------------------
+        if config.pipelines:
+            # Use new modular pipeline configuration
+            pipelines = create_pipelines_from_config(
+                pipelines_config=config.pipelines,
+                llm=llm,
+                tracker=tracker,
+            )
+            logger.info(f"Created {len(pipelines)} pipelines from config")
+        else:
+            # Fallback to legacy pipeline configuration
+            logger.warning("No pipelines configured, using legacy configuration")
+            from workflows.genai_news import GenAINewsPipeline
+            from workflows.product_ideas import ProductIdeasPipeline
+
+            pipelines = []
+            if config.PERSONA_GENAI_NEWS_ENABLED:
+                pipelines.append(GenAINewsPipeline(llm=llm, tracker=tracker))
+            if config.PERSONA_PRODUCT_IDEAS_ENABLED:
+                pipelines.append(ProductIdeasPipeline(llm=llm, tracker=tracker))
+
+        # ----------------------------
+        # Initialize delivery channels
+        # ----------------------------
+        deliveries = list[DeliveryChannel]([FileDelivery()])
+
+        if config.EMAIL_ENABLED:
+            deliveries.append(
+                HybridEmailDelivery(
+                    smtp_host=config.EMAIL_SMTP_HOST,
+                    smtp_port=config.EMAIL_SMTP_PORT,
+                    username=config.EMAIL_USERNAME,
+                    password=config.EMAIL_PASSWORD,
+                    sender=config.EMAIL_FROM,
+                    legacy_recipient=config.EMAIL_TO,
+                    colors=config.email_colors.model_dump(),
+                )
             )
-        )
 
-    if config.TELEGRAM_ENABLED:
-        deliveries.append(
-            TelegramDelivery(
-                bot_token=config.TELEGRAM_BOT_TOKEN,
-                chat_id=config.TELEGRAM_CHAT_ID,
+        if config.TELEGRAM_ENABLED:
+            deliveries.append(
+                TelegramDelivery(
+                    bot_token=config.TELEGRAM_BOT_TOKEN,
+                    chat_id=config.TELEGRAM_CHAT_ID,
+                )
             )
-        )
 
-    # ----------------------------
-    # Execute pipelines
-    # ----------------------------
-    for pipeline in pipelines:
-        try:
-            logger.info(f"Running persona pipeline: {pipeline.name}")
-            entries = await pipeline.run()
+        # ----------------------------
+        # Execute pipelines
+        # ----------------------------
+        logger.info(f"Running {len(pipelines)} persona pipelines concurrently")
+        results = await run_all(pipelines)
 
+        for pipeline, entries in zip(pipelines, results):
             if not entries:
                 logger.info(f"No entries for persona {pipeline.name}")
                 continue
@@ -121,9 +122,12 @@ async def main() -> None:
                     logger.error(
                         f"Delivery failed: persona={pipeline.name}, channel={delivery.name}, error={e}"
                     )
-
-        except Exception as e:
-            logger.exception(f"Pipeline failed: {pipeline.name}: {e}")
+    finally:
+        # Shut down shared services even when a pipeline or delivery raised;
+        # a leaked Database keeps its aiosqlite worker thread alive forever
+        tracker.close()
+        await db.close()
+        await llm.aclose()
 
     logger.info("Digest run completed")
     end_time = time.perf_counter()
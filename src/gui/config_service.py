@@ -12,6 +12,8 @@ import logging
 import aiofiles
 from threading import Lock
 
+from services.config import load_config
+
 logger = logging.getLogger(__name__)
 
 # Thread pool for file operations
@@ -62,6 +64,10 @@ async def write_config_async(config: Dict[str, Any]) -> bool:
         async with aiofiles.open(config_path, 'w', encoding='utf-8') as f:
             await f.write(yaml_content)
 
+        # Drop the memoized Config so the next load_config() call re-reads
+        # the file just written instead of serving the stale snapshot
+        load_config.cache_clear()
+
         logger.info("Configuration updated successfully")
         return True
     except Exception as e:
@@ -264,61 +264,69 @@ async def run_digest_async(persona: Optional[str] = None):
     vector_store = VectorStore(config.FAISS_INDEX_PATH)
     tracker = DigestTracker(db, vector_store)
 
-    # Create pipelines
-    pipelines = create_pipelines_from_config(
-        pipelines_config=config.pipelines,
-        llm=llm,
-        tracker=tracker,
-    )
-
-    # Filter by persona if specified
-    if persona:
-        pipelines = [p for p in pipelines if p.name == persona]
-
-    # Initialize delivery
-    deliveries = [FileDelivery()]
-
-    if config.EMAIL_ENABLED:
-        deliveries.append(
-            MultiUserEmailDelivery(
-                smtp_host=config.EMAIL_SMTP_HOST,
-                smtp_port=config.EMAIL_SMTP_PORT,
-                username=config.EMAIL_USERNAME,
-                password=config.EMAIL_PASSWORD,
-                sender=config.EMAIL_FROM,
-                colors=config.email_colors.model_dump(),
-            )
+    try:
+        # Create pipelines
+        pipelines = create_pipelines_from_config(
+            pipelines_config=config.pipelines,
+            llm=llm,
+            tracker=tracker,
         )
 
-    results = []
+        # Filter by persona if specified
+        if persona:
+            pipelines = [p for p in pipelines if p.name == persona]
+
+        # Initialize delivery
+        deliveries = [FileDelivery()]
+
+        if config.EMAIL_ENABLED:
+            deliveries.append(
+                MultiUserEmailDelivery(
+                    smtp_host=config.EMAIL_SMTP_HOST,
+                    smtp_port=config.EMAIL_SMTP_PORT,
+                    username=config.EMAIL_USERNAME,
+                    password=config.EMAIL_PASSWORD,
+                    sender=config.EMAIL_FROM,
+                    colors=config.email_colors.model_dump(),
+                )
+            )
 
-    for pipeline in pipelines:
-        try:
-            entries = await pipeline.run()
+        results = []
 
-            if entries:
-                for delivery in deliveries:
-                    await delivery.deliver(
-                        persona=pipeline.name,
-                        digest_date=today,
-                        entries=entries,
-                    )
-                results.append({
-                    'pipeline': pipeline.name,
-                    'entries': len(entries),
-                    'status': 'success'
-                })
-            else:
+        for pipeline in pipelines:
+            try:
+                entries = await pipeline.run()
+
+                if entries:
+                    for delivery in deliveries:
+                        await delivery.deliver(
+                            persona=pipeline.name,
+                            digest_date=today,
+                            entries=entries,
+                        )
+                    results.append({
+                        'pipeline': pipeline.name,
+                        'entries': len(entries),
+                        'status': 'success'
+                    })
+                else:
+                    results.append({
+                        'pipeline': pipeline.name,
+                        'entries': 0,
+                        'status': 'no_content'
+                    })
+            except Exception as e:
                 results.append({
                     'pipeline': pipeline.name,
-                    'entries': 0,
-                    'status': 'no_content'
+                    'status': 'error',
+                    'error': str(e)
                 })
-        except Exception as e:
-            results.append({
-                'pipeline': pipeline.name,
-                'status': 'error',
-                'error': str(e)
-            })
+    finally:
+        # The GUI process is long-lived: a run that skips these leaks the
+        # aiosqlite worker thread, the HTTP pool, and the tracker's WAL
+        # handle until process exit
+        tracker.close()
+        await db.close()
+        await llm.aclose()
 
     return results
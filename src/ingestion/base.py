@@ -1,6 +1,7 @@
 """
 Base classes for Ingestion
 """
+import functools
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Optional
@@ -9,7 +10,7 @@ from pydantic import BaseModel
 
 class IngestedItem(BaseModel):
     """
-    dataclass for IngestedItem 
+    dataclass for IngestedItem
     """
     source: str
     external_id: Optional[str]
@@ -19,6 +20,11 @@ class IngestedItem(BaseModel):
     published_at: Optional[datetime]
     engagement_score: Optional[float]
 
+    @functools.cached_property
+    def summary_preview(self) -> str:
+        """First 400 characters of the content; sliced once per item."""
+        return self.content[:400]
+
 
 class SourceAdapter(ABC):
     """
@@ -2,20 +2,67 @@
 Ingest data from Hackernew
 """
 
-from datetime import datetime, timedelta
+import json
+import time
+from datetime import datetime
 from logging import Logger
-from typing import List
+from typing import List, Optional
 import httpx
 
 
 from ingestion.base import SourceAdapter, IngestedItem
 
+# cysimdjson parses the ~200 small item payloads per run several times
+# faster than stdlib json; the parser must be reused across calls
+try:
+    import cysimdjson
+    _HN_PARSER = cysimdjson.JSONParser()
+except ImportError:
+    _HN_PARSER = None
+
+
+def _parse_story(payload: bytes) -> Optional[dict]:
+    """
+    Extract only the fields needed by IngestedItem from an HN item payload.
+    Returns None for deleted items and non-stories.
+    """
+    if _HN_PARSER is not None:
+        doc = _HN_PARSER.parse(payload)
+
+        def at(pointer: str, default=None):
+            try:
+                return doc.at_pointer(pointer)
+            except (KeyError, IndexError, ValueError):
+                return default
+
+        if at("/type") != "story":
+            return None
+        return {
+            "title": at("/title", ""),
+            "text": at("/text") or "",
+            "url": at("/url", ""),
+            "time": at("/time", 0),
+            "score": at("/score", 0),
+        }
+
+    data = json.loads(payload)
+    if not data or data.get("type") != "story":
+        return None
+    return {
+        "title": data.get("title", ""),
+        "text": data.get("text", "") or "",
+        "url": data.get("url", ""),
+        "time": data.get("time", 0),
+        "score": data.get("score", 0),
+    }
+
 
 class HackerNewsAdapter(SourceAdapter):
     BASE_URL = "https://hacker-news.firebaseio.com/v0"
 
     async def fetch_items(self, hours: int) -> List[IngestedItem]:
-        cutoff = datetime.now() - timedelta(hours=hours)
+        # Compare raw unix timestamps; only build datetime objects for keepers
+        cutoff_ts = time.time() - hours * 3600
         items: List[IngestedItem] = []
 
         try:
@@ -30,23 +77,24 @@ class HackerNewsAdapter(SourceAdapter):
                     if story.status_code != 200:
                         continue
 
-                    data = story.json()
-                    if not data or data.get("type") != "story":
+                    data = _parse_story(story.content)
+                    if data is None:
                         continue
 
-                    published = datetime.fromtimestamp(data.get("time", 0))
-                    if published < cutoff:
+                    published_ts = data["time"]
+                    if published_ts < cutoff_ts:
                         continue
+                    published = datetime.fromtimestamp(published_ts)
 
                     items.append(
                         IngestedItem(
                             source="hackernews",
                             external_id=str(sid),
-                            title=data.get("title", ""),
-                            content=data.get("text", "") or "",
-                            url=data.get("url", ""),
+                            title=data["title"],
+                            content=data["text"],
+                            url=data["url"],
                             published_at=published,
-                            engagement_score=float(data.get("score", 0)),
+                            engagement_score=float(data["score"]),
                         )
                     )
 
@@ -1,5 +1,6 @@
+import time
 import httpx
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List
 
 from ingestion.base import SourceAdapter, IngestedItem
@@ -9,7 +10,8 @@ class RedditAdapter(SourceAdapter):
         self.subreddit = subreddit
 
     async def fetch_items(self, hours: int) -> List[IngestedItem]:
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        # Compare raw unix timestamps; only build datetime objects for keepers
+        cutoff_ts = time.time() - hours * 3600
         items: List[IngestedItem] = []
 
         headers = {"User-Agent": "local-intel-digest/1.0"}
@@ -25,10 +27,10 @@ class RedditAdapter(SourceAdapter):
 
                 for post in posts:
                     data = post["data"]
-                    published = datetime.utcfromtimestamp(
-                        data.get("created_utc", 0))
-                    if published < cutoff:
+                    published_ts = data.get("created_utc", 0)
+                    if published_ts < cutoff_ts:
                         continue
+                    published = datetime.utcfromtimestamp(published_ts)
 
                     items.append(
                         IngestedItem(
@@ -2,13 +2,133 @@
 Ingestion from RSS sources
 """
 
-from datetime import datetime, timedelta
-from typing import List
+import io
+import xml.sax
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
 import feedparser
+import httpx
 
 from ingestion.base import SourceAdapter, IngestedItem
 
 
+class _FeedHandler(xml.sax.handler.ContentHandler):
+    """
+    Minimal SAX handler for RSS/Atom feeds.
+    Captures only the fields needed to build an IngestedItem, so parsing
+    stays constant-memory regardless of feed size.
+    """
+
+    _ITEM_TAGS = {"item", "entry"}
+    _TEXT_TAGS = {
+        "title", "link", "summary", "description",
+        "published", "pubdate", "updated", "id", "guid",
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.entries: List[Dict[str, str]] = []
+        self._current: Optional[Dict[str, str]] = None
+        self._field: Optional[str] = None
+        self._buffer: List[str] = []
+
+    def startElement(self, name, attrs):
+        tag = name.rsplit(":", 1)[-1].lower()
+        if tag in self._ITEM_TAGS:
+            self._current = {}
+        elif self._current is not None and tag in self._TEXT_TAGS:
+            self._field = tag
+            self._buffer = []
+            # Atom puts the URL in <link href="..."/> instead of text content
+            if tag == "link" and attrs.get("href"):
+                self._current.setdefault("link", attrs.get("href"))
+
+    def characters(self, content):
+        if self._field is not None:
+            self._buffer.append(content)
+
+    def endElement(self, name):
+        tag = name.rsplit(":", 1)[-1].lower()
+        if tag in self._ITEM_TAGS:
+            if self._current:
+                self.entries.append(self._current)
+            self._current = None
+            self._field = None
+        elif self._current is not None and tag == self._field:
+            text = "".join(self._buffer).strip()
+            if text and tag not in self._current:
+                self._current[tag] = text
+            self._field = None
+
+
+# Reused across calls; ExpatParser re-initializes itself on the next parse()
+_parser = xml.sax.make_parser()
+_parser.setFeature(xml.sax.handler.feature_external_ges, False)
+
+
+def _parse_published(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC-822 or ISO-8601 date string into a naive UTC datetime."""
+    if not value:
+        return None
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _parse_feed_sax(data: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse feed bytes incrementally with SAX.
+    Returns normalized entry dicts (id, title, content, link, published).
+    """
+    handler = _FeedHandler()
+    _parser.setContentHandler(handler)
+    _parser.parse(io.BytesIO(data))
+
+    entries = []
+    for raw in handler.entries:
+        entries.append({
+            "id": raw.get("id") or raw.get("guid"),
+            "title": raw.get("title", ""),
+            "content": raw.get("summary") or raw.get("description") or "",
+            "link": raw.get("link", ""),
+            "published": _parse_published(
+                raw.get("published") or raw.get("pubdate") or raw.get("updated")
+            ),
+        })
+    return entries
+
+
+def _parse_feed_fallback(data: bytes) -> List[Dict[str, Any]]:
+    """Fall back to feedparser's DOM-style parser for feeds SAX cannot handle."""
+    feed = feedparser.parse(data)
+
+    entries = []
+    for entry in feed.entries:
+        published = None
+        if hasattr(entry, "published_parsed") and entry.published_parsed:
+            published = datetime(*entry.published_parsed[:6])
+
+        entries.append({
+            "id": entry.get("id"),
+            "title": entry.get("title", ""),
+            "content": entry.get("summary", ""),
+            "link": entry.get("link", ""),
+            "published": published,
+        })
+    return entries
+
+
 class RSSAdapter(SourceAdapter):
     def __init__(self, feed_urls: List[str], source_name: str):
         self.feed_urls = feed_urls
@@ -18,31 +138,38 @@ class RSSAdapter(SourceAdapter):
         cutoff = datetime.utcnow() - timedelta(hours=hours)
         items: List[IngestedItem] = []
 
-        for url in self.feed_urls:
-            try:
-                feed = feedparser.parse(url)
-
-                for entry in feed.entries:
-                    published = None
-                    if hasattr(entry, "published_parsed") and entry.published_parsed:
-                        published = datetime(*entry.published_parsed[:6])
-
-                    if published and published < cutoff:
-                        continue
-
-                    items.append(
-                        IngestedItem(
-                            source=self.source_name,
-                            external_id=entry.get("id"),
-                            title=entry.get("title", ""),
-                            content=entry.get("summary", ""),
-                            url=entry.get("link", ""),
-                            published_at=published,
-                            engagement_score=None,
+        # One client for all feeds; connections are reused across URLs on
+        # the same host instead of a fresh pool (and handshake) per feed
+        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+            for url in self.feed_urls:
+                try:
+                    resp = await client.get(url)
+                    resp.raise_for_status()
+                    data = resp.content
+
+                    try:
+                        entries = _parse_feed_sax(data)
+                    except Exception:
+                        entries = _parse_feed_fallback(data)
+
+                    for entry in entries:
+                        published = entry["published"]
+                        if published and published < cutoff:
+                            continue
+
+                        items.append(
+                            IngestedItem(
+                                source=self.source_name,
+                                external_id=entry["id"],
+                                title=entry["title"],
+                                content=entry["content"],
+                                url=entry["link"],
+                                published_at=published,
+                                engagement_score=None,
+                            )
                         )
-                    )
 
-            except Exception:
-                continue
+                except Exception:
+                    continue
 
         return items
@@ -1,10 +1,11 @@
 """
 Source Factory - Creates ingestion adapters from configuration.
 """
+import asyncio
 import logging
-from typing import List
+from typing import Callable, Dict, List, Optional
 
-from ingestion.base import SourceAdapter
+from ingestion.base import SourceAdapter, IngestedItem
 from ingestion.reddit import RedditAdapter
 from ingestion.rss import RSSAdapter
 from ingestion.hackernews import HackerNewsAdapter
@@ -14,6 +15,31 @@ from services.config import SourceConfig, IngestionConfig, get_enabled_sources
 logger = logging.getLogger(__name__)
 
 
+def _build_reddit(config: SourceConfig) -> SourceAdapter:
+    if not config.subreddit:
+        raise ValueError("Reddit source requires 'subreddit' field")
+    return RedditAdapter(config.subreddit)
+
+
+def _build_rss(config: SourceConfig) -> SourceAdapter:
+    if not config.feeds:
+        raise ValueError("RSS source requires 'feeds' field")
+    return RSSAdapter(
+        feed_urls=config.feeds,
+        source_name=config.name or "rss",
+    )
+
+
+# Source type -> adapter builder, built once at import time.
+# New source types only need a new entry here.
+_REGISTRY: Dict[str, Callable[[SourceConfig], SourceAdapter]] = {
+    "reddit": _build_reddit,
+    "rss": _build_rss,
+    "hackernews": lambda _: HackerNewsAdapter(),
+    "producthunt": lambda _: ProductHuntAdapter(),
+}
+
+
 def create_source_adapter(source_config: SourceConfig) -> SourceAdapter:
     """
     Create a source adapter from configuration.
@@ -27,29 +53,12 @@ def create_source_adapter(source_config: SourceConfig) -> SourceAdapter:
     Raises:
         ValueError: If source type is unknown
     """
-    source_type = source_config.type.lower()
-
-    if source_type == "reddit":
-        if not source_config.subreddit:
-            raise ValueError("Reddit source requires 'subreddit' field")
-        return RedditAdapter(source_config.subreddit)
-
-    elif source_type == "rss":
-        if not source_config.feeds:
-            raise ValueError("RSS source requires 'feeds' field")
-        return RSSAdapter(
-            feed_urls=source_config.feeds,
-            source_name=source_config.name or "rss",
-        )
-
-    elif source_type == "hackernews":
-        return HackerNewsAdapter()
+    try:
+        builder = _REGISTRY[source_config.type.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown source type: {source_config.type.lower()}") from None
 
-    elif source_type == "producthunt":
-        return ProductHuntAdapter()
-
-    else:
-        raise ValueError(f"Unknown source type: {source_type}")
+    return builder(source_config)
 
 
 def create_adapters_from_config(ingestion_config: IngestionConfig) -> List[SourceAdapter]:
@@ -74,3 +83,38 @@ def create_adapters_from_config(ingestion_config: IngestionConfig) -> List[Sourc
             logger.error(f"Failed to create adapter for {source_config.type}: {e}")
 
     return adapters
+
+
+async def fetch_all(
+    adapters: List[SourceAdapter],
+    hours: int,
+    predicate: Optional[Callable[[IngestedItem], bool]] = None,
+) -> List[IngestedItem]:
+    """
+    Fetch items from all adapters concurrently and flatten the results.
+
+    Sources are independent I/O-bound calls, so wall-clock time is the
+    slowest source rather than the sum. Failed sources are logged and
+    skipped.
+
+    When predicate is given, each source's batch is filtered as soon as
+    that source finishes, so rejected items are freed immediately and peak
+    memory is the survivors plus one raw batch - not every source's full
+    result held at once.
+    """
+    async def fetch_one(adapter: SourceAdapter) -> List[IngestedItem]:
+        try:
+            return await adapter.fetch_items(hours)
+        except Exception as e:
+            logger.error(f"Source {adapter.__class__.__name__} failed: {e}")
+            return []
+
+    items: List[IngestedItem] = []
+    for next_result in asyncio.as_completed([fetch_one(a) for a in adapters]):
+        batch = await next_result
+        if predicate is not None:
+            items.extend(item for item in batch if predicate(item))
+        else:
+            items.extend(batch)
+
+    return items
@@ -1,7 +1,11 @@
-import json
+import functools
 import logging
 import re
-from typing import List, Dict, Any
+from string import Template
+from typing import AsyncIterator, List, Dict, Any, Type
+
+import orjson
+from pydantic import TypeAdapter
 
 from core.personas import Persona
 from core.scoring import passes_threshold
@@ -9,6 +13,99 @@ from services.llm import OllamaClient
 
 logger = logging.getLogger(__name__)
 
+_CODEBLOCK_RE = re.compile(r'^```(?:json)?\s*\n?(.*?)\n?```$', re.DOTALL)
+_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# Prompt templates are built once at import time; evaluate_batch only fills in
+# the per-call values (item list, counts).
+_GENAI_TMPL = Template("""You are a GenAI/ML news curator. Analyze these $n items and select the TOP $top_k most relevant for developers.
+
+ITEMS (JSON array):
+$items_text
+
+For each of the TOP $top_k items, provide a JSON object with:
+- id: the item ID (must match exactly)
+- relevance_score: float 0.0-1.0
+- topic: category (LLM, Inference, Training, Agents, Tools, etc.)
+- why_it_matters: 1 sentence explanation
+- target_audience: "developer", "architect", or "manager"
+- decision: "include"
+
+Return ONLY a JSON array with AT MOST $top_k items, sorted by relevance (highest first). Do NOT duplicate items.
+Example: [{"id": "0", "relevance_score": 0.9, "topic": "LLM", "why_it_matters": "...", "target_audience": "developer", "decision": "include"}]
+
+JSON array:""")
+
+_PRODUCT_TMPL = Template("""You are a product ideas curator. Analyze these $n items and select the TOP $top_k most valuable for founders/builders.
+
+ITEMS (JSON array):
+$items_text
+
+For each of the TOP $top_k items, provide a JSON object with:
+- id: the item ID (must match exactly)
+- idea_type: category (SaaS, Tool, Platform, API, Mobile App, etc.)
+- problem_statement: 1 sentence about the problem
+- solution_summary: 1 sentence about the solution
+- maturity_level: "idea", "mvp", "early_traction", or "scaling"
+- reusability_score: float 0.0-1.0
+- decision: "include"
+
+Return ONLY a JSON array with AT MOST $top_k items, sorted by reusability (highest first). Do NOT duplicate items.
+Example: [{"id": "0", "idea_type": "SaaS", "problem_statement": "...", "solution_summary": "...", "maturity_level": "mvp", "reusability_score": 0.8, "decision": "include"}]
+
+JSON array:""")
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_list_adapter(schema: Type) -> TypeAdapter:
+    """One cached TypeAdapter per persona schema for whole-list validation."""
+    return TypeAdapter(List[schema])
+
+
+class _JsonObjectExtractor:
+    """
+    Incrementally pulls complete top-level JSON objects out of streamed text.
+
+    Tracks brace depth with string/escape awareness, so objects inside the
+    response array surface as soon as their closing brace arrives - before
+    the rest of the array has been generated.
+    """
+
+    def __init__(self) -> None:
+        self._buf: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._capturing = False
+
+    def feed(self, text: str) -> List[str]:
+        """Consume a chunk; return any objects completed by it."""
+        complete = []
+        for ch in text:
+            if self._capturing:
+                self._buf.append(ch)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                self._depth += 1
+                if self._depth == 1:
+                    self._capturing = True
+                    self._buf = ['{']
+            elif ch == '}' and self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    complete.append("".join(self._buf))
+                    self._capturing = False
+                    self._buf = []
+        return complete
+
 
 def _extract_json(content: str) -> str:
     """
@@ -16,14 +113,17 @@ def _extract_json(content: str) -> str:
     """
     content = content.strip()
 
+    # Fast path: clean output that already starts with a JSON array
+    if content.startswith('['):
+        return content
+
     # Remove markdown code blocks (```json ... ``` or ``` ... ```)
-    pattern = r'^```(?:json)?\s*\n?(.*?)\n?```$'
-    match = re.match(pattern, content, re.DOTALL)
+    match = _CODEBLOCK_RE.match(content)
     if match:
         return match.group(1).strip()
 
     # Try to find JSON array in the content
-    array_match = re.search(r'\[.*\]', content, re.DOTALL)
+    array_match = _ARRAY_RE.search(content)
     if array_match:
         return array_match.group(0)
 
@@ -84,51 +184,15 @@ async def evaluate_batch(
     # If fewer items than top_k, only request what we have
     actual_k = min(len(items), top_k)
 
-    # Build compact items list - only titles and short content to fit in context
-    items_text = ""
-    for item in items:
-        # Keep content very short to fit all items
-        content_preview = item['content'][:200].replace('\n', ' ').strip()
-        items_text += f"[{item['id']}] {item['title']}\n"
-
-    # Build prompt based on persona
-    if persona.name == "GENAI_NEWS":
-        prompt = f"""You are a GenAI/ML news curator. Analyze these {len(items)} items and select the TOP {actual_k} most relevant for developers.
-
-ITEMS:
-{items_text}
-
-For each of the TOP {actual_k} items, provide a JSON object with:
-- id: the item ID (must match exactly)
-- relevance_score: float 0.0-1.0
-- topic: category (LLM, Inference, Training, Agents, Tools, etc.)
-- why_it_matters: 1 sentence explanation
-- target_audience: "developer", "architect", or "manager"
-- decision: "include"
-
-Return ONLY a JSON array with AT MOST {actual_k} items, sorted by relevance (highest first). Do NOT duplicate items.
-Example: [{{"id": "0", "relevance_score": 0.9, "topic": "LLM", "why_it_matters": "...", "target_audience": "developer", "decision": "include"}}]
-
-JSON array:"""
-    else:  # PRODUCT_IDEAS
-        prompt = f"""You are a product ideas curator. Analyze these {len(items)} items and select the TOP {actual_k} most valuable for founders/builders.
+    # Build compact items list - only IDs and titles, serialized as compact
+    # JSON so the prompt spends fewer tokens than formatted lines
+    items_text = orjson.dumps(
+        [{"id": item["id"], "title": item["title"][:200]} for item in items]
+    ).decode()
 
-ITEMS:
-{items_text}
-
-For each of the TOP {actual_k} items, provide a JSON object with:
-- id: the item ID (must match exactly)
-- idea_type: category (SaaS, Tool, Platform, API, Mobile App, etc.)
-- problem_statement: 1 sentence about the problem
-- solution_summary: 1 sentence about the solution
-- maturity_level: "idea", "mvp", "early_traction", or "scaling"
-- reusability_score: float 0.0-1.0
-- decision: "include"
-
-Return ONLY a JSON array with AT MOST {actual_k} items, sorted by reusability (highest first). Do NOT duplicate items.
-Example: [{{"id": "0", "idea_type": "SaaS", "problem_statement": "...", "solution_summary": "...", "maturity_level": "mvp", "reusability_score": 0.8, "decision": "include"}}]
-
-JSON array:"""
+    # Pick the precompiled prompt template for this persona
+    tmpl = _GENAI_TMPL if persona.name == "GENAI_NEWS" else _PRODUCT_TMPL
+    prompt = tmpl.substitute(n=len(items), top_k=actual_k, items_text=items_text)
 
     try:
         response = await llm.evaluate(prompt)
@@ -144,49 +208,125 @@ JSON array:"""
 
     # Parse the response
     try:
-        parsed_list = json.loads(clean_json)
-    except json.JSONDecodeError as e:
+        parsed_list = orjson.loads(clean_json)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON response: {e}")
         logger.error(f"Raw content: {raw_content}")
         raise ValueError(f"Invalid JSON response from LLM: {e}")
 
-    results = []
-    seen_ids = set()  # Track IDs to prevent duplicates
-
+    # Drop duplicate IDs before validation
+    deduped = []
+    seen_ids = set()
     for parsed_item in parsed_list:
         item_id = str(parsed_item.get("id", ""))
-
-        # Skip duplicates
         if item_id in seen_ids:
             logger.warning(f"Skipping duplicate item {item_id}")
             continue
+        seen_ids.add(item_id)
+        deduped.append((item_id, parsed_item))
 
-        # Validate against schema
-        try:
-            validated = persona.evaluation_schema.model_validate(parsed_item)
-            parsed_dict = validated.model_dump()
-
+    # Validate the whole list in one pydantic-core call; fall back to
+    # per-item validation only when the batch contains invalid entries
+    results = []
+    try:
+        validated_list = _schema_list_adapter(persona.evaluation_schema).validate_python(
+            [parsed_item for _, parsed_item in deduped]
+        )
+        for (item_id, _), validated in zip(deduped, validated_list):
             results.append({
                 "id": item_id,
-                "parsed": parsed_dict,
+                "parsed": validated.model_dump(),
                 "decision": "include",
             })
-            seen_ids.add(item_id)
             logger.info(f"Selected item {item_id} for inclusion")
-        except Exception as e:
-            logger.warning(f"Validation failed for item {item_id}: {e}")
-            # Still include with raw data if validation fails
+    except Exception as batch_error:
+        logger.warning(f"Batch validation failed, validating per item: {batch_error}")
+        for item_id, parsed_item in deduped:
+            try:
+                validated = persona.evaluation_schema.model_validate(parsed_item)
+                parsed_dict = validated.model_dump()
+            except Exception as e:
+                logger.warning(f"Validation failed for item {item_id}: {e}")
+                # Still include with raw data if validation fails
+                parsed_dict = parsed_item
+
             results.append({
                 "id": item_id,
-                "parsed": parsed_item,
+                "parsed": parsed_dict,
                 "decision": "include",
             })
-            seen_ids.add(item_id)
 
     logger.info(f"Evaluation complete: {len(results)} items selected")
     return results[:actual_k]  # Ensure we return at most actual_k (never more than available items)
 
 
+async def evaluate_batch_stream(
+    *,
+    llm: OllamaClient,
+    persona: Persona,
+    items: List[Dict[str, Any]],
+    top_k: int = 5,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming variant of evaluate_batch: yields each evaluation as soon as
+    its JSON object completes in the model output, so callers can post-process
+    early results while the LLM is still decoding the rest.
+
+    Yields dicts with the same 'id', 'parsed', 'decision' keys as
+    evaluate_batch, in generation order, at most min(len(items), top_k).
+    """
+    if not items:
+        return
+
+    logger.info(f"Evaluating {len(items)} items and selecting top {top_k} (streaming)")
+
+    actual_k = min(len(items), top_k)
+
+    items_text = orjson.dumps(
+        [{"id": item["id"], "title": item["title"][:200]} for item in items]
+    ).decode()
+
+    tmpl = _GENAI_TMPL if persona.name == "GENAI_NEWS" else _PRODUCT_TMPL
+    prompt = tmpl.substitute(n=len(items), top_k=actual_k, items_text=items_text)
+
+    extractor = _JsonObjectExtractor()
+    seen_ids = set()
+    yielded = 0
+
+    async for chunk in llm.evaluate_stream(prompt):
+        for obj_text in extractor.feed(chunk):
+            try:
+                parsed_item = orjson.loads(obj_text)
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Skipping malformed streamed object: {e}")
+                continue
+
+            item_id = str(parsed_item.get("id", ""))
+            if item_id in seen_ids:
+                logger.warning(f"Skipping duplicate item {item_id}")
+                continue
+            seen_ids.add(item_id)
+
+            try:
+                validated = persona.evaluation_schema.model_validate(parsed_item)
+                parsed_dict = validated.model_dump()
+            except Exception as e:
+                logger.warning(f"Validation failed for item {item_id}: {e}")
+                # Still include with raw data if validation fails
+                parsed_dict = parsed_item
+
+            logger.info(f"Selected item {item_id} for inclusion")
+            yield {
+                "id": item_id,
+                "parsed": parsed_dict,
+                "decision": "include",
+            }
+
+            yielded += 1
+            if yielded >= actual_k:
+                return
+
+
 def select_top_k(entries: List, top_k: int) -> List:
     """Select up to top_k unique entries.
     If entries count is less than top_k, do not duplicate; just return available unique entries.
@@ -1,4 +1,6 @@
+import functools
 import logging
+import re
 from typing import Iterable, Optional, Tuple
 
 from ingestion.base import IngestedItem
@@ -7,9 +9,21 @@ from services.digest_tracker import DigestTracker
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_keywords(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile a keyword set into one alternation pattern.
+
+    A single compiled scan replaces one `in` pass per keyword; memoized so
+    each pipeline's keyword list compiles once per process.
+    """
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
 def keyword_match(text: str, keywords: Iterable[str]) -> bool:
-    text = text.lower()
-    return any(k.lower() in text for k in keywords)
+    keywords = tuple(keywords)
+    if not keywords:
+        return False
+    return _compile_keywords(keywords).search(text) is not None
 
 
 def passes_prefilter(
@@ -19,19 +33,21 @@ def passes_prefilter(
     min_engagement: float | None = None,
     min_length: int = 200,
 ) -> bool:
-    """Basic prefilter for keyword and engagement checks."""
-    content = f"{item.title} {item.content}"
+    """Basic prefilter for keyword and engagement checks.
 
-    if len(content) < min_length:
-        return False
+    Checks are ordered cheapest-first so most rejections happen before any
+    string work: engagement compare, then length, then keyword scan.
+    """
+    if min_engagement is not None:
+        if item.engagement_score is None or item.engagement_score < min_engagement:
+            return False
 
-    if keywords and not keyword_match(content, keywords):
+    if len(item.title) + 1 + len(item.content) < min_length:
         return False
 
-    if min_engagement is not None:
-        if item.engagement_score is None:
-            return False
-        if item.engagement_score < min_engagement:
+    if keywords:
+        pattern = _compile_keywords(tuple(keywords))
+        if not (pattern.search(item.title) or pattern.search(item.content)):
             return False
 
     return True
@@ -72,6 +88,9 @@ async def filter_duplicates(
     Returns:
         List of items that are NOT duplicates
     """
+    # One SQL query for the whole batch; is_duplicate then runs on sets
+    await tracker.load_recent()
+
     unique_items = []
     seen_urls = set()
 
@@ -2,16 +2,24 @@
 Loads and handles config from config.yml
 Email credentials (EMAIL_USERNAME, EMAIL_PASSWORD) are loaded from .env for security
 """
+import functools
 import os
 from typing import List, Dict, Any, Optional
 
 import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# libyaml's C loader is 5-10x faster than the pure-Python parser; fall back
+# when PyYAML was built without it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class SourceConfig(BaseModel):
     """Configuration for a single ingestion source."""
+    # Frozen: sources are read-only after parsing
+    model_config = ConfigDict(frozen=True)
+
     type: str  # reddit, rss, hackernews, producthunt
     enabled: bool = True
     subreddit: Optional[str] = None  # For reddit
@@ -62,6 +70,10 @@ class PipelineConfig(BaseModel):
 
 class EmailColorsConfig(BaseModel):
     """Configuration for email template colors."""
+    # Frozen: edits go through the GUI's YAML config service, never through
+    # the loaded model; also keeps the shared default instance safe to reuse
+    model_config = ConfigDict(frozen=True)
+
     primary: str = "#6366f1"
     primary_dark: str = "#4f46e5"
     secondary: str = "#10b981"
@@ -75,6 +87,11 @@ class EmailColorsConfig(BaseModel):
     why_it_matters_text: str = "#92400e"
 
 
+# Shared default palette; avoids re-materializing the model when config.yml
+# has no email_colors overrides
+_DEFAULT_EMAIL_COLORS = EmailColorsConfig.model_construct()
+
+
 class Config(BaseModel):
     # Core
     DATABASE_PATH: str
@@ -114,13 +131,56 @@ class Config(BaseModel):
     pipelines: List[PipelineConfig] = []
 
 
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
+
 def _bool(value: str | bool) -> bool:
     """Convert string or bool to boolean."""
     if isinstance(value, bool):
         return value
-    return str(value).lower() in ("1", "true", "yes", "on")
+    return str(value).lower() in _TRUTHY
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    return int(value) if value else None
+
+
+def _identity(value: Any) -> Any:
+    return value
+
 
+# Scalar config.yml fields as (default, cast), iterated in one pass by
+# load_config instead of a per-field get()+cast chain
+_SCALAR_FIELDS: Dict[str, tuple] = {
+    "DATABASE_PATH": ("data/app.db", _identity),
+    "FAISS_INDEX_PATH": ("data/faiss.index", _identity),
+    "OLLAMA_BASE_URL": ("http://localhost:11434", _identity),
+    "OLLAMA_MODEL": ("llama3.1:8b", _identity),
+    "PERSONA_GENAI_NEWS_ENABLED": (False, _bool),
+    "PERSONA_PRODUCT_IDEAS_ENABLED": (False, _bool),
+    "GENAI_NEWS_MIN_RELEVANCE": (0.4, float),
+    "PRODUCT_IDEAS_MIN_REUSABILITY": (0.5, float),
+    "EMAIL_ENABLED": (False, _bool),
+    "EMAIL_SMTP_HOST": (None, _identity),
+    "EMAIL_SMTP_PORT": (None, _optional_int),
+    "EMAIL_FROM": (None, _identity),
+    "EMAIL_TO": (None, _identity),
+    "TELEGRAM_ENABLED": (False, _bool),
+}
 
+
+_dotenv_loaded = False
+
+
+def _load_dotenv_once() -> None:
+    """Parse .env exactly once per process."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+@functools.lru_cache(maxsize=1)
 def _get_config_path() -> str:
     """Get the path to config.yml, handling different working directories."""
     # Try relative path first
@@ -140,7 +200,7 @@ def _parse_ingestion_config(data: Dict[str, Any]) -> IngestionConfig:
     """Parse ingestion configuration from YAML data."""
     sources = []
     for src in data.get("sources", []):
-        sources.append(SourceConfig(
+        sources.append(SourceConfig.model_construct(
             type=src.get("type", ""),
             enabled=src.get("enabled", True),
             subreddit=src.get("subreddit"),
@@ -148,7 +208,7 @@ def _parse_ingestion_config(data: Dict[str, Any]) -> IngestionConfig:
             feeds=src.get("feeds"),
         ))
 
-    return IngestionConfig(
+    return IngestionConfig.model_construct(
         sources=sources,
         keywords=data.get("keywords", []),
         min_engagement=data.get("min_engagement", 5),
@@ -161,7 +221,7 @@ def _parse_pipeline_config(name: str, data: Dict[str, Any]) -> PipelineConfig:
     ingestion_data = data.get("ingestion", {})
     ingestion = _parse_ingestion_config(ingestion_data)
 
-    return PipelineConfig(
+    return PipelineConfig.model_construct(
         name=name,
         enabled=_bool(data.get("enabled", True)),
         persona_name=data.get("persona", name.upper()),
@@ -174,15 +234,20 @@ def _parse_pipeline_config(name: str, data: Dict[str, Any]) -> PipelineConfig:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from config.yml and email credentials from .env."""
+    """Load configuration from config.yml and email credentials from .env.
+
+    The result is memoized; call reload_config() to force a re-read.
+    """
     # Load .env for sensitive credentials
-    load_dotenv()
+    _load_dotenv_once()
 
     config_path = _get_config_path()
 
-    with open(config_path, 'r') as file:
-        config = yaml.safe_load(file)
+    # libyaml consumes bytes directly, skipping a decode/re-encode round trip
+    with open(config_path, 'rb') as file:
+        config = yaml.load(file, Loader=_YamlLoader)
 
     # Parse ingestion configurations
     ingestion = config.get("ingestion", {})
@@ -206,29 +271,24 @@ def load_config() -> Config:
             import logging
             logging.getLogger(__name__).error(f"Failed to parse pipeline '{pipeline_name}': {e}")
 
-    return Config(
-        DATABASE_PATH=config.get("DATABASE_PATH", "data/app.db"),
-        FAISS_INDEX_PATH=config.get("FAISS_INDEX_PATH", "data/faiss.index"),
-
-        OLLAMA_BASE_URL=config.get("OLLAMA_BASE_URL", "http://localhost:11434"),
-        OLLAMA_MODEL=config.get("OLLAMA_MODEL", "llama3.1:8b"),
-
-        PERSONA_GENAI_NEWS_ENABLED=_bool(config.get("PERSONA_GENAI_NEWS_ENABLED", False)),
-        PERSONA_PRODUCT_IDEAS_ENABLED=_bool(config.get("PERSONA_PRODUCT_IDEAS_ENABLED", False)),
+    # Cast the plain scalar fields through the table in a single pass
+    scalars = {
+        key: cast(config[key]) if key in config else default
+        for key, (default, cast) in _SCALAR_FIELDS.items()
+    }
 
-        GENAI_NEWS_MIN_RELEVANCE=float(config.get("GENAI_NEWS_MIN_RELEVANCE", 0.4)),
-        PRODUCT_IDEAS_MIN_REUSABILITY=float(config.get("PRODUCT_IDEAS_MIN_REUSABILITY", 0.5)),
+    # The YAML has already been shape-parsed above; skip re-validation
+    return Config.model_construct(
+        **scalars,
 
-        EMAIL_ENABLED=_bool(config.get("EMAIL_ENABLED", False)),
-        EMAIL_SMTP_HOST=config.get("EMAIL_SMTP_HOST"),
-        EMAIL_SMTP_PORT=int(config.get("EMAIL_SMTP_PORT", 587)) if config.get("EMAIL_SMTP_PORT") else None,
         EMAIL_USERNAME=os.getenv("EMAIL_USERNAME"),
         EMAIL_PASSWORD=os.getenv("EMAIL_PASSWORD"),
-        EMAIL_FROM=config.get("EMAIL_FROM"),
-        EMAIL_TO=config.get("EMAIL_TO"),
-        email_colors=EmailColorsConfig(**config.get("email_colors", {})),
+        email_colors=(
+            EmailColorsConfig(**email_colors_data)
+            if (email_colors_data := config.get("email_colors"))
+            else _DEFAULT_EMAIL_COLORS
+        ),
 
-        TELEGRAM_ENABLED=_bool(config.get("TELEGRAM_ENABLED", False)),
         TELEGRAM_BOT_TOKEN=os.getenv("TELEGRAM_BOT_TOKEN"),
         TELEGRAM_CHAT_ID=os.getenv("TELEGRAM_CHAT_ID"),
 
@@ -238,6 +298,12 @@ def load_config() -> Config:
     )
 
 
+def reload_config() -> Config:
+    """Clear the memoized config and load it fresh (mainly for tests)."""
+    load_config.cache_clear()
+    return load_config()
+
+
 def get_enabled_sources(ingestion_config: IngestionConfig) -> List[SourceConfig]:
     """Get only enabled sources from an ingestion config."""
     return [src for src in ingestion_config.sources if src.enabled]
@@ -1,7 +1,9 @@
+import asyncio
+import time
 import aiosqlite
+import numpy as np
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
-from typing import AsyncIterator, List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,16 +12,33 @@ logger = logging.getLogger(__name__)
 class Database:
     def __init__(self, path: str):
         self.path = path
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
 
     @asynccontextmanager
     async def connect(self) -> AsyncIterator[aiosqlite.Connection]:
-        conn = await aiosqlite.connect(self.path)
-        await conn.execute("PRAGMA journal_mode=WAL;")
-        await conn.execute("PRAGMA foreign_keys=ON;")
-        try:
-            yield conn
-        finally:
-            await conn.close()
+        """
+        Yield the shared connection, serialized by a lock.
+
+        The connection is created lazily on first use and the PRAGMAs run
+        once, instead of per query.
+        """
+        async with self._lock:
+            if self._conn is None:
+                conn = await aiosqlite.connect(self.path)
+                await conn.execute("PRAGMA journal_mode=WAL;")
+                await conn.execute("PRAGMA foreign_keys=ON;")
+                await conn.execute("PRAGMA synchronous=NORMAL;")
+                await conn.execute("PRAGMA temp_store=MEMORY;")
+                self._conn = conn
+            yield self._conn
+
+    async def close(self) -> None:
+        """Close the shared connection. Safe to call when never opened."""
+        async with self._lock:
+            if self._conn is not None:
+                await self._conn.close()
+                self._conn = None
 
     async def execute(self, query: str, params: tuple = ()) -> None:
         async with self.connect() as conn:
@@ -47,7 +66,7 @@ class Database:
                     relevance_score REAL,
                     persona TEXT NOT NULL,
                     faiss_id INTEGER,
-                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    sent_at INTEGER NOT NULL DEFAULT (strftime('%s','now')),
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
@@ -57,26 +76,62 @@ class Database:
             await conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_sent_digests_sent_at ON sent_digests(sent_at)
             """)
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sent_digests_persona_sent_at
+                ON sent_digests(persona, sent_at DESC)
+            """)
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sent_digests_sent_at_faiss
+                ON sent_digests(sent_at) WHERE faiss_id IS NOT NULL
+            """)
+            # One-time migration: rows written before sent_at became an
+            # epoch integer hold ISO-8601 TEXT, which SQLite orders after
+            # every integer - those rows would count as "recent" forever
+            # and never age out of cleanup
+            await conn.execute("""
+                UPDATE sent_digests
+                SET sent_at = CAST(strftime('%s', sent_at) AS INTEGER)
+                WHERE typeof(sent_at) = 'text'
+            """)
             await conn.commit()
             logger.info("Database tables initialized")
 
     async def is_url_sent(self, url: str, hours: int = 48) -> bool:
         """Check if URL was already sent within the specified hours."""
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        cutoff_ts = int(time.time()) - hours * 3600
         result = await self.fetchone(
             "SELECT 1 FROM sent_digests WHERE url = ? AND sent_at > ?",
-            (url, cutoff.isoformat())
+            (url, cutoff_ts)
         )
         return result is not None
 
-    async def get_recent_faiss_ids(self, hours: int = 48) -> List[int]:
-        """Get FAISS IDs of digests sent within the specified hours."""
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
+    async def get_recent_faiss_ids(self, hours: int = 48) -> np.ndarray:
+        """Get FAISS IDs of digests sent within the specified hours.
+
+        Returns a contiguous int64 array, ready for faiss.IDSelectorBatch.
+        """
+        cutoff_ts = int(time.time()) - hours * 3600
         rows = await self.fetchall(
             "SELECT faiss_id FROM sent_digests WHERE sent_at > ? AND faiss_id IS NOT NULL",
-            (cutoff.isoformat(),)
+            (cutoff_ts,)
+        )
+        return np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+
+    async def get_recent_url_and_faiss_sets(
+        self, hours: int = 48
+    ) -> Tuple[Set[str], Set[int]]:
+        """
+        Get both the URLs and FAISS IDs of digests sent within the specified
+        hours in a single query, for batch deduplication.
+        """
+        cutoff_ts = int(time.time()) - hours * 3600
+        rows = await self.fetchall(
+            "SELECT url, faiss_id FROM sent_digests WHERE sent_at > ?",
+            (cutoff_ts,)
         )
-        return [row[0] for row in rows]
+        urls = {row[0] for row in rows}
+        faiss_ids = {row[1] for row in rows if row[1] is not None}
+        return urls, faiss_ids
 
     async def add_sent_digest(
         self,
@@ -86,18 +141,29 @@ class Database:
         relevance_score: Optional[float] = None,
         faiss_id: Optional[int] = None,
     ) -> int:
-        """Record a sent digest in the database."""
+        """Record a sent digest in the database.
+
+        Re-sends of a known URL update the existing row in place; unlike
+        INSERT OR REPLACE this keeps the rowid stable and only rewrites the
+        index entries for columns that actually changed.
+        """
         async with self.connect() as conn:
             cursor = await conn.execute(
                 """
-                INSERT OR REPLACE INTO sent_digests 
+                INSERT INTO sent_digests
                 (url, title, relevance_score, persona, faiss_id, sent_at)
                 VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    sent_at = excluded.sent_at,
+                    relevance_score = excluded.relevance_score,
+                    faiss_id = excluded.faiss_id
+                RETURNING id
                 """,
-                (url, title, relevance_score, persona, faiss_id, datetime.utcnow().isoformat())
+                (url, title, relevance_score, persona, faiss_id, int(time.time()))
             )
+            row = await cursor.fetchone()
             await conn.commit()
-            return cursor.lastrowid
+            return row[0]
 
     async def get_recent_digests(
         self,
@@ -105,14 +171,14 @@ class Database:
         persona: Optional[str] = None
     ) -> List[Tuple[int, str, str, float, str]]:
         """Get digests sent within the specified hours."""
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        cutoff_ts = int(time.time()) - hours * 3600
         if persona:
             rows = await self.fetchall(
                 """SELECT id, url, title, relevance_score, persona 
                    FROM sent_digests 
                    WHERE sent_at > ? AND persona = ?
                    ORDER BY sent_at DESC""",
-                (cutoff.isoformat(), persona)
+                (cutoff_ts, persona)
             )
         else:
             rows = await self.fetchall(
@@ -120,17 +186,17 @@ class Database:
                    FROM sent_digests 
                    WHERE sent_at > ?
                    ORDER BY sent_at DESC""",
-                (cutoff.isoformat(),)
+                (cutoff_ts,)
             )
         return rows
 
     async def cleanup_old_digests(self, days: int = 30) -> int:
         """Remove digests older than specified days."""
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff_ts = int(time.time()) - days * 86400
         async with self.connect() as conn:
             cursor = await conn.execute(
                 "DELETE FROM sent_digests WHERE sent_at < ?",
-                (cutoff.isoformat(),)
+                (cutoff_ts,)
             )
             await conn.commit()
             return cursor.rowcount
@@ -2,10 +2,14 @@
 DigestTracker - Combines SQL database and FAISS for deduplication.
 Tracks sent digests and checks for similar content using semantic embeddings.
 """
+import atexit
 import hashlib
 import logging
+from collections import OrderedDict
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 from services.database import Database
 from services.vector_store import VectorStore
 
@@ -21,27 +25,45 @@ def simple_embedding(text: str, dim: int = 384) -> List[float]:
     # Normalize text
     text = text.lower().strip()
 
-    # Create multiple hash variations for better distribution
-    embeddings = []
-    for i in range(dim):
-        # Create a unique hash for each dimension
-        hash_input = f"{text}_{i}"
-        hash_bytes = hashlib.sha256(hash_input.encode()).digest()
-        # Convert to float in range [-1, 1]
-        value = (int.from_bytes(hash_bytes[:4], 'big') / (2**32)) * 2 - 1
-        embeddings.append(value)
+    # One SHAKE-256 XOF call yields dim 4-byte words; a single vectorized
+    # scale maps them to [-1, 1] instead of dim per-dimension SHA rounds
+    raw = hashlib.shake_256(text.encode()).digest(dim * 4)
+    values = np.frombuffer(raw, dtype='>u4').astype(np.float32)
+    values = values * np.float32(2.0 / 2**32) - np.float32(1.0)
+
+    return values.tolist()
+
 
-    return embeddings
+# Embedding cache keyed by a 16-byte blake2b digest of the input text, so
+# the cache holds fixed-size keys rather than the texts themselves. LRU via
+# OrderedDict: hits move to the back, eviction pops the front.
+_EMBED_CACHE: "OrderedDict[Tuple[bytes, int], Tuple[float, ...]]" = OrderedDict()
+_EMBED_CACHE_MAX = 2048
 
 
 def text_to_embedding(title: str, content: str = "", dim: int = 384) -> List[float]:
     """
     Convert title and content to an embedding vector.
     Combines title (weighted higher) with content preview.
+
+    Results are memoized: is_duplicate and record_sent_digest see the same
+    item in one run, and personas sharing a source see the same item across
+    runs, so repeat calls are cache hits.
     """
     # Weight title more heavily by repeating it
     combined_text = f"{title} {title} {content[:200]}"
-    return simple_embedding(combined_text, dim)
+    key = (hashlib.blake2b(combined_text.encode(), digest_size=16).digest(), dim)
+
+    vec = _EMBED_CACHE.get(key)
+    if vec is None:
+        vec = tuple(simple_embedding(combined_text, dim))
+        if len(_EMBED_CACHE) >= _EMBED_CACHE_MAX:
+            _EMBED_CACHE.popitem(last=False)
+        _EMBED_CACHE[key] = vec
+    else:
+        _EMBED_CACHE.move_to_end(key)
+
+    return list(vec)
 
 
 class DigestTracker:
@@ -50,6 +72,9 @@ class DigestTracker:
     and FAISS (for semantic similarity).
     """
 
+    # Persist the FAISS index at most every N inserts; flush() covers the rest
+    FLUSH_EVERY = 50
+
     def __init__(
         self,
         database: Database,
@@ -62,6 +87,15 @@ class DigestTracker:
         self.similarity_threshold = similarity_threshold
         self.dedup_hours = dedup_hours
         self._initialized = False
+        self._unflushed = 0
+
+        # Per-run dedup cache primed by load_recent(); None means uncached
+        self._recent_urls: Optional[set] = None
+        self._recent_faiss_ids: Optional[set] = None
+
+        # Safety net so buffered index additions survive process exit;
+        # close() unregisters it so finished trackers are not kept alive
+        atexit.register(self.flush)
 
     async def initialize(self) -> None:
         """Initialize the database tables."""
@@ -69,6 +103,16 @@ class DigestTracker:
             await self.db.init_tables()
             self._initialized = True
 
+    async def load_recent(self) -> None:
+        """
+        Prime the dedup cache with one SQL query covering both URL and
+        FAISS-ID recency, instead of two queries per candidate item.
+        """
+        await self.initialize()
+        self._recent_urls, self._recent_faiss_ids = (
+            await self.db.get_recent_url_and_faiss_sets(hours=self.dedup_hours)
+        )
+
     async def is_duplicate(
         self,
         url: str,
@@ -84,29 +128,43 @@ class DigestTracker:
         """
         await self.initialize()
 
-        # Check 1: Exact URL match
-        if await self.db.is_url_sent(url, hours=self.dedup_hours):
+        # Check 1: Exact URL match (in-memory when load_recent() was called)
+        if self._recent_urls is not None:
+            if url in self._recent_urls:
+                logger.debug(f"Duplicate URL found: {url}")
+                return True, "exact_url_match"
+        elif await self.db.is_url_sent(url, hours=self.dedup_hours):
             logger.debug(f"Duplicate URL found: {url}")
             return True, "exact_url_match"
 
         # Check 2: Semantic similarity using FAISS
         if self.vector_store.index.ntotal > 0:
-            embedding = text_to_embedding(title, content)
+            # Get IDs of recently sent digests before hashing: on cold runs
+            # (or after cleanup) there is nothing to compare against, so the
+            # embedding would be wasted work
+            if self._recent_faiss_ids is not None:
+                recent_faiss_ids = self._recent_faiss_ids
+            else:
+                recent_faiss_ids = await self.db.get_recent_faiss_ids(hours=self.dedup_hours)
 
-            # Get IDs of recently sent digests
-            recent_faiss_ids = await self.db.get_recent_faiss_ids(hours=self.dedup_hours)
+            if len(recent_faiss_ids):
+                embedding = text_to_embedding(title, content)
 
-            if recent_faiss_ids:
-                # Search for similar items
-                results = self.vector_store.search(embedding, k=min(10, self.vector_store.index.ntotal))
+                # Search for similar items; FAISS itself restricts candidates
+                # to the recently sent IDs
+                indices, scores = self.vector_store.search_batch(
+                    np.asarray(embedding, dtype=np.float32).reshape(1, -1),
+                    k=min(10, self.vector_store.index.ntotal),
+                    allowed_ids=recent_faiss_ids,
+                )
 
-                for faiss_id, score in results:
-                    if faiss_id == -1:
-                        continue
-                    # Only consider as duplicate if it's in recent digests
-                    if faiss_id in recent_faiss_ids and score >= self.similarity_threshold:
-                        logger.debug(f"Similar content found: {title} (score: {score:.3f})")
-                        return True, f"similar_content_{score:.3f}"
+                # One vectorized mask over the result row instead of a
+                # per-hit Python loop
+                mask = (indices[0] != -1) & (scores[0] >= self.similarity_threshold)
+                if mask.any():
+                    score = float(scores[0][mask].max())
+                    logger.debug(f"Similar content found: {title} (score: {score:.3f})")
+                    return True, f"similar_content_{score:.3f}"
 
         return False, None
 
@@ -139,12 +197,87 @@ class DigestTracker:
             faiss_id=faiss_id,
         )
 
-        # Persist FAISS index
-        self.vector_store.persist()
+        # Keep the per-run dedup cache consistent with what was just recorded
+        if self._recent_urls is not None:
+            self._recent_urls.add(url)
+        if self._recent_faiss_ids is not None:
+            self._recent_faiss_ids.add(faiss_id)
+
+        # Persist the FAISS index in batches rather than per insert
+        self._unflushed += 1
+        if self._unflushed >= self.FLUSH_EVERY:
+            self.flush()
 
         logger.debug(f"Recorded digest: {title} (db_id={db_id}, faiss_id={faiss_id})")
         return db_id
 
+    async def record_sent_digest_batch(
+        self,
+        persona: str,
+        records: List[Tuple[str, str, Optional[float], str]],
+    ) -> List[int]:
+        """
+        Record several sent digests at once.
+
+        records are (url, title, relevance_score, content) tuples. All
+        embeddings are added to FAISS in a single batched call instead of
+        one index insert per digest.
+
+        Returns:
+            The database IDs of the recorded digests, in input order.
+        """
+        if not records:
+            return []
+
+        await self.initialize()
+
+        embeddings = np.array(
+            [text_to_embedding(title, content) for _, title, _, content in records],
+            dtype=np.float32,
+        )
+        faiss_ids = self.vector_store.add_batch(embeddings)
+
+        db_ids = []
+        for (url, title, relevance_score, _), faiss_id in zip(records, faiss_ids):
+            db_id = await self.db.add_sent_digest(
+                url=url,
+                title=title,
+                persona=persona,
+                relevance_score=relevance_score,
+                faiss_id=faiss_id,
+            )
+            db_ids.append(db_id)
+
+            if self._recent_urls is not None:
+                self._recent_urls.add(url)
+            if self._recent_faiss_ids is not None:
+                self._recent_faiss_ids.add(faiss_id)
+
+        self._unflushed += len(records)
+        if self._unflushed >= self.FLUSH_EVERY:
+            self.flush()
+
+        logger.debug(f"Recorded {len(records)} digests for {persona}")
+        return db_ids
+
+    def flush(self) -> None:
+        """Persist buffered FAISS additions. Call once at the end of a run."""
+        self.vector_store.persist()
+        self._unflushed = 0
+
+    def close(self) -> None:
+        """
+        Flush and release the vector store at the end of a run.
+
+        Also detaches the exit hook: without this, every tracker a process
+        ever created stays pinned until exit, and a stale instance's
+        exit-time flush could checkpoint an outdated index over a newer
+        one sharing the same files.
+        """
+        self.flush()
+        self.vector_store.close()
+        atexit.unregister(self.flush)
+
     async def get_recent_digests(
         self,
         hours: int = 48,
@@ -1,7 +1,8 @@
 import time
 import asyncio
+import functools
 import logging
-from typing import Dict, Any, List
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 
 from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage
@@ -9,6 +10,15 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Summarize prompt pieces, built once; the default-length header is
+# pre-rendered so the common call is a single concatenation
+_SUMMARIZE_HEADER_TMPL = (
+    "Summarize the following text in {max_length} characters or less.\n"
+    "Be concise and capture the key points.\n\nText: "
+)
+_SUMMARIZE_HEADER_200 = _SUMMARIZE_HEADER_TMPL.format(max_length=200)
+_SUMMARIZE_SUFFIX = "\n\nSummary:"
+
 
 class OllamaClient:
     """
@@ -44,7 +54,36 @@ class OllamaClient:
             num_ctx=4096,  # Context window size
         )
 
-    async def _invoke_with_retry(self, messages: List[HumanMessage]) -> Any:
+        # Pooled client for direct Ollama API calls (health checks etc.);
+        # keep-alive avoids a fresh TCP handshake per request
+        self._http = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+
+    async def aclose(self) -> None:
+        """Shut down the pooled HTTP client."""
+        await self._http.aclose()
+
+    async def _stream_once(self, messages: List[HumanMessage]) -> Tuple[str, Optional[int]]:
+        """
+        Stream one generation, concatenating chunks as they arrive.
+
+        Returns the full content and the time-to-first-token in ms.
+        """
+        start = time.time()
+        first_token_ms: Optional[int] = None
+        chunks: List[str] = []
+
+        async for chunk in self.llm.astream(messages):
+            if first_token_ms is None:
+                first_token_ms = int((time.time() - start) * 1000)
+            if chunk.content:
+                chunks.append(chunk.content)
+
+        return "".join(chunks), first_token_ms
+
+    async def _invoke_with_retry(self, messages: List[HumanMessage]) -> Tuple[str, Optional[int]]:
         """
         Invoke LLM with retry logic for connection failures.
         """
@@ -52,11 +91,10 @@ class OllamaClient:
 
         for attempt in range(1, self.max_retries + 1):
             try:
-                response = await asyncio.wait_for(
-                    self.llm.ainvoke(messages),
+                return await asyncio.wait_for(
+                    self._stream_once(messages),
                     timeout=self.timeout,
                 )
-                return response
 
             except asyncio.TimeoutError:
                 last_exception = TimeoutError(
@@ -89,29 +127,93 @@ class OllamaClient:
     async def evaluate(self, prompt: str) -> Dict[str, Any]:
         """
         Evaluate a prompt and return the response with metadata.
+
+        Responses are streamed and concatenated incrementally;
+        first_token_ms exposes the time-to-first-token.
         """
         start = time.time()
 
-        response = await self._invoke_with_retry([HumanMessage(content=prompt)])
+        content, first_token_ms = await self._invoke_with_retry(
+            [HumanMessage(content=prompt)]
+        )
 
         latency_ms = int((time.time() - start) * 1000)
 
         return {
-            "raw": response,
-            "content": response.content,
+            "raw": content,
+            "content": content,
             "latency_ms": latency_ms,
+            "first_token_ms": first_token_ms,
         }
 
-    async def summarize(self, text: str, max_length: int = 200) -> str:
+    async def evaluate_stream(self, prompt: str) -> AsyncIterator[str]:
         """
-        Summarize text using the LLM.
+        Yield response text chunks as the model generates them.
+
+        Lets callers start parsing before the full response has decoded.
+        Each chunk is subject to an inactivity deadline of self.timeout,
+        so a stalled server raises instead of hanging the pipeline run.
+        Connection failures and timeouts before the first chunk retry like
+        _invoke_with_retry; once output has been yielded a restart would
+        duplicate it, so later failures propagate to the consumer.
         """
-        prompt = f"""Summarize the following text in {max_length} characters or less.
-Be concise and capture the key points.
+        messages = [HumanMessage(content=prompt)]
+        last_exception = None
+
+        for attempt in range(1, self.max_retries + 1):
+            yielded = False
+            try:
+                stream = self.llm.astream(messages).__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            stream.__anext__(), timeout=self.timeout
+                        )
+                    except StopAsyncIteration:
+                        return
+                    if chunk.content:
+                        yield chunk.content
+                        yielded = True
+
+            except asyncio.TimeoutError:
+                last_exception = TimeoutError(
+                    f"Stream stalled for {self.timeout}s"
+                )
+                if yielded:
+                    raise last_exception
+                logger.warning(
+                    f"Attempt {attempt}/{self.max_retries}: Timeout, retrying..."
+                )
+
+            except Exception as e:
+                error_msg = str(e)
+
+                if yielded or (
+                    "connection" not in error_msg.lower()
+                    and "connect" not in error_msg.lower()
+                ):
+                    # Mid-stream or non-connection errors don't retry
+                    raise
+
+                last_exception = e
+                logger.warning(
+                    f"Attempt {attempt}/{self.max_retries}: Connection error - {error_msg} (base_url={self.base_url}, model={self.model})"
+                )
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_delay * attempt)
 
-Text: {text}
+        raise last_exception or Exception("All connection attempts failed")
 
-Summary:"""
+    async def summarize(self, text: str, max_length: int = 200) -> str:
+        """
+        Summarize text using the LLM.
+        """
+        if max_length == 200:
+            header = _SUMMARIZE_HEADER_200
+        else:
+            header = _SUMMARIZE_HEADER_TMPL.format(max_length=max_length)
+        prompt = header + text + _SUMMARIZE_SUFFIX
 
         result = await self.evaluate(prompt)
         return result["content"].strip()
@@ -122,13 +224,24 @@ Summary:"""
         """
         url = f"{self.base_url}/api/tags"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(url)
-                if resp.status_code == 200:
-                    return True
-                logger.error(f"Ollama health check failed: {resp.status_code} {resp.text}")
-                return False
+            resp = await self._http.get(url)
+            if resp.status_code == 200:
+                return True
+            logger.error(f"Ollama health check failed: {resp.status_code} {resp.text}")
+            return False
         except Exception as e:
             logger.error(f"Ollama health check error: {e} (url={url})")
             return False
 
+
+@functools.lru_cache(maxsize=4)
+def get_shared_client(base_url: str, model: str) -> OllamaClient:
+    """
+    Process-wide OllamaClient per (base_url, model).
+
+    Pipelines that construct their own client each get their own HTTP
+    connection pool; sharing one keeps connections warm across pipelines
+    running concurrently against the same server.
+    """
+    return OllamaClient(base_url=base_url, model=model)
+
@@ -1,5 +1,6 @@
 import logging
-import json
+
+import orjson
 
 
 class JsonFormatter(logging.Formatter):
@@ -10,7 +11,7 @@ class JsonFormatter(logging.Formatter):
             "message": record.getMessage(),
             "module": record.module,
         }
-        return json.dumps(payload)
+        return orjson.dumps(payload).decode()
 
 
 def setup_logging(level: int = logging.INFO) -> None:
@@ -1,9 +1,15 @@
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 
 
 def next_run_time(hour: int = 8) -> datetime:
-    now = datetime.now()
-    run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
-    if run <= now:
-        run += timedelta(days=1)
-    return run
+    """Next local occurrence of hour:00:00, strictly in the future.
+
+    Pure integer arithmetic on the epoch timestamp: one modulo instead of
+    building and comparing intermediate datetime objects.
+    """
+    now = time.time()
+    lt = time.localtime(now)
+    secs_today = (lt.tm_hour * 60 + lt.tm_min) * 60 + lt.tm_sec
+    delta = (hour * 3600 - secs_today) % 86400 or 86400
+    return datetime.fromtimestamp(int(now) + delta)
@@ -1,31 +1,204 @@
 import faiss
 import os
 import numpy as np
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
+
+# FAISS parallelizes search and add with OpenMP; half the logical cores
+# roughly matches physical cores and leaves room for the event loop
+faiss.omp_set_num_threads(max(1, (os.cpu_count() or 2) // 2))
 
 
 class VectorStore:
+    # HNSW graph parameters: M=32 neighbours per node is the usual
+    # recall/memory sweet spot; efSearch=64 keeps recall near-exact for the
+    # k<=10 dedup lookups while search stays sub-linear in index size
+    HNSW_M = 32
+    EF_CONSTRUCTION = 200
+    EF_SEARCH = 64
+
+    # Full index snapshots happen at most every N WAL'd vectors; the WAL
+    # keeps everything in between durable at O(new) write cost
+    SNAPSHOT_EVERY = 1000
+
     def __init__(self, path: str, dim: int = 384):
         self.path = path
         self.dim = dim
+        self._wal_path = path + ".wal"
 
         if os.path.exists(path):
+            # Existing indexes (including pre-HNSW flat ones) load as-is
             self.index = faiss.read_index(path)
         else:
-            self.index = faiss.IndexFlatIP(dim)
+            # 8-bit scalar quantization stores vectors at a quarter of the
+            # FP32 footprint; dedup search is memory-bound, so bandwidth
+            # saved is throughput gained. Accuracy stays well above the
+            # similarity thresholds used for dedup.
+            self.index = faiss.IndexHNSWSQ(
+                dim,
+                faiss.ScalarQuantizer.QT_8bit,
+                self.HNSW_M,
+                faiss.METRIC_INNER_PRODUCT,
+            )
+            self.index.hnsw.efConstruction = self.EF_CONSTRUCTION
+            self._train_quantizer()
+
+        hnsw = getattr(self.index, "hnsw", None)
+        if hnsw is not None:
+            hnsw.efSearch = self.EF_SEARCH
+
+        # Vectors written since the last snapshot live in the WAL too
+        self._pending = self._replay_wal()
+        self._wal = open(self._wal_path, "ab")
+        self._dirty = False
+
+    def _replay_wal(self) -> int:
+        """Re-add vectors logged after the last snapshot.
+
+        The WAL holds already-normalized float32 vectors appended by add
+        and add_batch; on startup they are replayed into the loaded index.
+        """
+        if not os.path.exists(self._wal_path):
+            return 0
+        data = np.fromfile(self._wal_path, dtype=np.float32)
+        if data.size == 0:
+            return 0
+        vecs = data.reshape(-1, self.dim)
+        self.index.add(vecs)
+        return vecs.shape[0]
+
+    def _log_vectors(self, vecs: np.ndarray) -> None:
+        """Append normalized vectors to the WAL; O(new) instead of O(total)."""
+        self._wal.write(vecs.tobytes())
+        self._wal.flush()
+        self._pending += vecs.shape[0]
+
+    def _train_quantizer(self) -> None:
+        """Train the scalar quantizer once, on a synthetic sample.
+
+        Training on the first real batch is a trap: a tiny batch (often a
+        single vector) yields degenerate per-dimension ranges, and every
+        later insert is quantized against them - exact re-sends then score
+        far below the dedup threshold, and a snapshot freezes the broken
+        ranges permanently. The hash embeddings are uniform over [-1, 1]
+        before normalization, so a large drawn-the-same-way sample fixes
+        the ranges regardless of what arrives first.
+        """
+        rng = np.random.default_rng(0)
+        sample = rng.uniform(-1.0, 1.0, size=(1024, self.dim)).astype(np.float32)
+        faiss.normalize_L2(sample)
+        self.index.train(sample)
 
     def add(self, vector: List[float]) -> int:
-        vec = np.array([vector]).astype("float32")
+        # asarray + reshape: one allocation (none when given a float32
+        # ndarray), versus the two copies of np.array([...]).astype(...)
+        vec = np.asarray(vector, dtype=np.float32).reshape(1, -1)
         faiss.normalize_L2(vec)
         idx = self.index.ntotal
         self.index.add(vec)
+        self._log_vectors(vec)
+        self._dirty = True
         return idx
 
-    def search(self, vector: List[float], k: int = 5) -> List[Tuple[int, float]]:
-        vec = np.array([vector]).astype("float32")
+    def add_batch(self, vectors: np.ndarray) -> List[int]:
+        """
+        Add N vectors in one FAISS call.
+
+        Normalization and insertion run once over the whole (N, dim) block
+        instead of crossing the Python/C boundary per vector.
+        """
+        arr = np.ascontiguousarray(vectors, dtype="float32")
+        faiss.normalize_L2(arr)
+        start = self.index.ntotal
+        self.index.add(arr)
+        self._log_vectors(arr)
+        self._dirty = True
+        return list(range(start, start + arr.shape[0]))
+
+    def search(
+        self,
+        vector: List[float],
+        k: int = 5,
+        allowed_ids: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Search for the k nearest vectors.
+
+        When allowed_ids is given, FAISS prunes everything else during the
+        scan, so results only contain those IDs.
+        """
+        vec = np.asarray(vector, dtype=np.float32).reshape(1, -1)
         faiss.normalize_L2(vec)
-        scores, indices = self.index.search(vec, k)
+
+        if allowed_ids is not None:
+            if isinstance(allowed_ids, np.ndarray):
+                ids = np.ascontiguousarray(allowed_ids, dtype=np.int64)
+            else:
+                ids = np.fromiter(allowed_ids, dtype=np.int64)
+            selector = faiss.IDSelectorBatch(ids)
+            if hasattr(self.index, "hnsw"):
+                params = faiss.SearchParametersHNSW(sel=selector, efSearch=self.EF_SEARCH)
+            else:
+                params = faiss.SearchParameters(sel=selector)
+            scores, indices = self.index.search(vec, k, params=params)
+        else:
+            scores, indices = self.index.search(vec, k)
+
         return list(zip(indices[0].tolist(), scores[0].tolist()))
 
-    def persist(self) -> None:
+    def search_batch(
+        self,
+        vectors: np.ndarray,
+        k: int = 5,
+        allowed_ids: Optional[Iterable[int]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search for the k nearest vectors of N queries at once.
+
+        Normalization and the index scan each run once over the (N, dim)
+        block, so SIMD lanes stay packed instead of processing one row at
+        a time.
+
+        Returns:
+            (indices, scores) arrays of shape (N, k)
+        """
+        arr = np.ascontiguousarray(vectors, dtype="float32")
+        faiss.normalize_L2(arr)
+
+        if allowed_ids is not None:
+            if isinstance(allowed_ids, np.ndarray):
+                ids = np.ascontiguousarray(allowed_ids, dtype=np.int64)
+            else:
+                ids = np.fromiter(allowed_ids, dtype=np.int64)
+            selector = faiss.IDSelectorBatch(ids)
+            if hasattr(self.index, "hnsw"):
+                params = faiss.SearchParametersHNSW(sel=selector, efSearch=self.EF_SEARCH)
+            else:
+                params = faiss.SearchParameters(sel=selector)
+            scores, indices = self.index.search(arr, k, params=params)
+        else:
+            scores, indices = self.index.search(arr, k)
+
+        return indices, scores
+
+    def persist(self, force: bool = False) -> None:
+        """Checkpoint the index to disk.
+
+        New vectors are already durable in the WAL, so the O(total) full
+        snapshot only runs once enough of them accumulate (or on force),
+        after which the WAL is truncated.
+        """
+        if not self._dirty:
+            return
+        if not force and self._pending < self.SNAPSHOT_EVERY:
+            return
         faiss.write_index(self.index, self.path)
+        self._wal.truncate(0)
+        self._pending = 0
+        self._dirty = False
+
+    def close(self) -> None:
+        """Checkpoint if due and release the WAL handle. Idempotent."""
+        if self._wal.closed:
+            return
+        self.persist()
+        self._wal.close()
@@ -4,12 +4,12 @@ from typing import List, Optional
 
 from core.entities import DigestEntry
 from core.personas import GENAI_NEWS
-from ingestion.source_factory import create_adapters_from_config
-from processing.prefilter import passes_prefilter, filter_duplicates
+from ingestion.source_factory import create_adapters_from_config, fetch_all
+from processing.prefilter import filter_duplicates, passes_prefilter
 from processing.summarizer import summarize_cluster
 from processing.evaluator import evaluate_batch
-from services.llm import OllamaClient
-from services.config import load_config
+from services.llm import OllamaClient, get_shared_client
+from services.config import Config, load_config
 from services.database import Database
 from services.vector_store import VectorStore
 from services.digest_tracker import DigestTracker
@@ -25,14 +25,15 @@ class GenAINewsPipeline(PersonaPipeline):
         self,
         llm: Optional[OllamaClient] = None,
         tracker: Optional[DigestTracker] = None,
+        config: Optional[Config] = None,
     ):
-        config = load_config()
+        # load_config() is memoized, so the fallback costs one parse per
+        # process no matter how many pipelines are constructed
+        config = config or load_config()
         self.config = config
 
-        self.llm = llm or OllamaClient(
-            base_url=config.OLLAMA_BASE_URL,
-            model=config.OLLAMA_MODEL,
-        )
+        # Default to the shared client so pipelines reuse one connection pool
+        self.llm = llm or get_shared_client(config.OLLAMA_BASE_URL, config.OLLAMA_MODEL)
 
         # Initialize tracker for deduplication
         if tracker:
@@ -60,37 +61,28 @@ class GenAINewsPipeline(PersonaPipeline):
         digest_entries: List[DigestEntry] = []
 
         try:
-            # Fetch all items from sources
-            items = []
-            for source in self.sources:
-                items.extend(await source.fetch_items(hours=24))
-
-            logger.info(f"Fetched {len(items)} items from sources")
-
-            # Pre-filter items by keywords and engagement
-            filtered_items = []
-            for item in items:
-                if passes_prefilter(
+            # Fetch from sources concurrently; the prefilter runs per source
+            # as results arrive, so rejected items never accumulate
+            items = await fetch_all(
+                self.sources,
+                hours=24,
+                predicate=lambda item: passes_prefilter(
                     item,
                     keywords=self.keywords,
                     min_engagement=self.min_engagement,
-                ):
-                    filtered_items.append(item)
+                ),
+            )
 
-            logger.info(f"After keyword filter: {len(filtered_items)} items")
-
-            if not filtered_items:
-                logger.info("No items passed pre-filter")
-                return []
+            logger.info(f"Fetched {len(items)} items passing prefilter")
 
             # Deduplication: Remove items already sent within 48 hours
-            unique_items = await filter_duplicates(filtered_items, self.tracker)
+            unique_items = await filter_duplicates(items, self.tracker)
 
             if not unique_items:
-                logger.info("No unique items after deduplication")
+                logger.info("No unique items after filtering")
                 return []
 
-            logger.info(f"After deduplication: {len(unique_items)} unique items")
+            logger.info(f"After filtering: {len(unique_items)} unique items")
 
             # Prepare batch for single LLM call
             batch_items = [
@@ -117,13 +109,15 @@ class GenAINewsPipeline(PersonaPipeline):
                 logger.error(f"Batch evaluation failed: {eval_error}")
                 return []
 
+            # Evaluations reference items by the string ids sent in the batch
+            items_by_id = {entry["id"]: item for entry, item in zip(batch_items, unique_items)}
+
             # Process results - only the selected top items
+            sent_records = []
             for eval_result in evaluations:
                 item_id = eval_result["id"]
-                try:
-                    item_idx = int(item_id)
-                    item = unique_items[item_idx]
-                except (ValueError, IndexError):
+                item = items_by_id.get(item_id)
+                if item is None:
                     logger.warning(f"Invalid item ID from LLM: {item_id}")
                     continue
 
@@ -136,7 +130,7 @@ class GenAINewsPipeline(PersonaPipeline):
                 entry = summarize_cluster(
                     persona=GENAI_NEWS,
                     title=item.title,
-                    summary=item.content[:400],
+                    summary=item.summary_preview,
                     why_it_matters=parsed.get("why_it_matters", "Relevant update in the GenAI ecosystem."),
                     audience=parsed.get("target_audience", "developer"),
                     source_urls=[item.url],
@@ -145,20 +139,19 @@ class GenAINewsPipeline(PersonaPipeline):
 
                 digest_entries.append(entry)
 
-                # Record sent digest for future deduplication
-                await self.tracker.record_sent_digest(
-                    url=item.url,
-                    title=item.title,
-                    persona=GENAI_NEWS.name,
-                    relevance_score=relevance_score,
-                    content=item.content,
-                )
+                # Queued for future deduplication; recorded in one batch below
+                sent_records.append((item.url, item.title, relevance_score, item.content))
 
                 logger.info(f"Included item: {item.title} (score: {relevance_score})")
 
+            await self.tracker.record_sent_digest_batch(GENAI_NEWS.name, sent_records)
+
         except Exception as e:
             logger.exception(f"Pipeline error: {e}")
             return []
+        finally:
+            # One FAISS index write per run instead of one per recorded digest
+            self.tracker.flush()
 
         # Return top_k items, already sorted by LLM
         return digest_entries[:self.top_k]
@@ -2,14 +2,16 @@
 Pipeline Factory - Creates pipelines from configuration.
 Makes the system fully modular and config-driven.
 """
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
 
 from core.entities import DigestEntry
-from ingestion.source_factory import create_adapters_from_config
-from processing.prefilter import passes_prefilter, filter_duplicates
+from ingestion.source_factory import create_adapters_from_config, fetch_all
+from processing.prefilter import filter_duplicates, passes_prefilter
 from processing.summarizer import summarize_cluster
-from processing.evaluator import evaluate_batch
+from processing.evaluator import evaluate_batch_stream
 from services.llm import OllamaClient
 from services.config import PipelineConfig
 from services.digest_tracker import DigestTracker
@@ -18,6 +20,12 @@ from workflows.base import PersonaPipeline
 logger = logging.getLogger(__name__)
 
 
+def _eval_hash(url: str, content: str) -> bytes:
+    """Fixed-size identity hash of an item, for cross-pipeline dedup."""
+    content_digest = hashlib.blake2b(content[:1024].encode(), digest_size=16).digest()
+    return hashlib.blake2b(url.encode() + content_digest, digest_size=16).digest()
+
+
 class ConfigurablePipeline(PersonaPipeline):
     """
     A generic, config-driven pipeline that works for any persona.
@@ -29,12 +37,17 @@ class ConfigurablePipeline(PersonaPipeline):
         pipeline_config: PipelineConfig,
         llm: OllamaClient,
         tracker: DigestTracker,
+        seen_hashes: Optional[Set[bytes]] = None,
     ):
         self.pipeline_config = pipeline_config
         self.persona = pipeline_config.persona
         self.llm = llm
         self.tracker = tracker
 
+        # Shared across pipelines in one process: items another persona has
+        # already sent to the LLM are not evaluated again
+        self._seen_hashes = seen_hashes if seen_hashes is not None else set()
+
         # Ingestion settings
         self.sources = create_adapters_from_config(pipeline_config.ingestion)
         self.keywords = pipeline_config.ingestion.keywords
@@ -52,49 +65,55 @@ class ConfigurablePipeline(PersonaPipeline):
     def name(self) -> str:
         return self.persona.name
 
+    def _passes_prefilter(self, item) -> bool:
+        return passes_prefilter(
+            item,
+            keywords=self.keywords,
+            min_engagement=self.min_engagement,
+        )
+
     async def run(self) -> List[DigestEntry]:
         digest_entries: List[DigestEntry] = []
 
         try:
-            # Fetch all items from sources
-            items = []
-            for source in self.sources:
-                try:
-                    fetched = await source.fetch_items(hours=self.fetch_hours)
-                    items.extend(fetched)
-                except Exception as e:
-                    logger.error(f"Source {source.__class__.__name__} failed: {e}")
+            # Fetch from sources concurrently; the prefilter runs per source
+            # as results arrive, so rejected items never accumulate
+            items = await fetch_all(
+                self.sources,
+                hours=self.fetch_hours,
+                predicate=self._passes_prefilter,
+            )
 
-            logger.info(f"[{self.name}] Fetched {len(items)} items from sources")
+            logger.info(f"[{self.name}] Fetched {len(items)} items passing prefilter")
 
             if not items:
                 logger.info(f"[{self.name}] No items fetched")
                 return []
 
-            # Pre-filter items by keywords and engagement
-            filtered_items = [
-                item for item in items
-                if passes_prefilter(
-                    item,
-                    keywords=self.keywords,
-                    min_engagement=self.min_engagement,
-                )
-            ]
-
-            logger.info(f"[{self.name}] After keyword filter: {len(filtered_items)} items")
-
-            if not filtered_items:
-                logger.info(f"[{self.name}] No items passed pre-filter")
-                return []
-
             # Deduplication: Remove items already sent
-            unique_items = await filter_duplicates(filtered_items, self.tracker)
+            unique_items = await filter_duplicates(items, self.tracker)
 
             if not unique_items:
-                logger.info(f"[{self.name}] No unique items after deduplication")
+                logger.info(f"[{self.name}] No unique items after filtering")
                 return []
 
-            logger.info(f"[{self.name}] After deduplication: {len(unique_items)} unique items")
+            logger.info(f"[{self.name}] After filtering: {len(unique_items)} unique items")
+
+            # Drop items another pipeline has already evaluated this run;
+            # LLM evaluation is the most expensive step in the system
+            fresh_items = []
+            for item in unique_items:
+                item_hash = _eval_hash(item.url, item.content)
+                if item_hash in self._seen_hashes:
+                    logger.debug(f"[{self.name}] Skipping cross-pipeline duplicate: {item.title}")
+                    continue
+                self._seen_hashes.add(item_hash)
+                fresh_items.append(item)
+
+            if not fresh_items:
+                logger.info(f"[{self.name}] All items already evaluated by another pipeline")
+                return []
+            unique_items = fresh_items
 
             # Prepare batch for single LLM call
             batch_items = [
@@ -109,67 +128,66 @@ class ConfigurablePipeline(PersonaPipeline):
 
             logger.info(f"[{self.name}] Sending {len(batch_items)} items for evaluation (selecting top {self.top_k})")
 
-            # Single LLM call for all items - returns top_k
+            # Evaluations reference items by the string ids sent in the batch
+            items_by_id = {entry["id"]: item for entry, item in zip(batch_items, unique_items)}
+
+            # Single LLM call for all items - results stream in one by one,
+            # so entry construction overlaps with the remaining decode time
+            sent_records = []
             try:
-                evaluations = await evaluate_batch(
+                async for eval_result in evaluate_batch_stream(
                     llm=self.llm,
                     persona=self.persona,
                     items=batch_items,
                     top_k=self.top_k,
-                )
+                ):
+                    item_id = eval_result["id"]
+                    item = items_by_id.get(item_id)
+                    if item is None:
+                        logger.warning(f"[{self.name}] Invalid item ID from LLM: {item_id}")
+                        continue
+
+                    parsed = eval_result.get("parsed")
+                    if not parsed:
+                        continue
+
+                    # Extract score using configured field
+                    score = parsed.get(self.score_field, 0.0)
+
+                    # Build why_it_matters from configured field(s)
+                    why_it_matters = self._build_why_it_matters(parsed)
+
+                    # Get audience from parsed or use default
+                    audience = parsed.get("target_audience", self.default_audience)
+
+                    entry = summarize_cluster(
+                        persona=self.persona,
+                        title=item.title,
+                        summary=item.summary_preview,
+                        why_it_matters=why_it_matters,
+                        audience=audience,
+                        source_urls=[item.url],
+                        structured_output=parsed,
+                    )
+
+                    digest_entries.append(entry)
+
+                    # Queued for future deduplication; recorded in one batch below
+                    sent_records.append((item.url, item.title, score, item.content))
+
+                    logger.info(f"[{self.name}] Included item: {item.title} (score: {score})")
             except Exception as eval_error:
                 logger.error(f"[{self.name}] Batch evaluation failed: {eval_error}")
                 return []
 
-            # Process results - only the selected top items
-            for eval_result in evaluations:
-                item_id = eval_result["id"]
-                try:
-                    item_idx = int(item_id)
-                    item = unique_items[item_idx]
-                except (ValueError, IndexError):
-                    logger.warning(f"[{self.name}] Invalid item ID from LLM: {item_id}")
-                    continue
-
-                parsed = eval_result.get("parsed")
-                if not parsed:
-                    continue
-
-                # Extract score using configured field
-                score = parsed.get(self.score_field, 0.0)
-
-                # Build why_it_matters from configured field(s)
-                why_it_matters = self._build_why_it_matters(parsed)
-
-                # Get audience from parsed or use default
-                audience = parsed.get("target_audience", self.default_audience)
-
-                entry = summarize_cluster(
-                    persona=self.persona,
-                    title=item.title,
-                    summary=item.content[:400],
-                    why_it_matters=why_it_matters,
-                    audience=audience,
-                    source_urls=[item.url],
-                    structured_output=parsed,
-                )
-
-                digest_entries.append(entry)
-
-                # Record sent digest for future deduplication
-                await self.tracker.record_sent_digest(
-                    url=item.url,
-                    title=item.title,
-                    persona=self.name,
-                    relevance_score=score,
-                    content=item.content,
-                )
-
-                logger.info(f"[{self.name}] Included item: {item.title} (score: {score})")
+            await self.tracker.record_sent_digest_batch(self.name, sent_records)
 
         except Exception as e:
             logger.exception(f"[{self.name}] Pipeline error: {e}")
             return []
+        finally:
+            # One FAISS index write per run instead of one per recorded digest
+            self.tracker.flush()
 
         return digest_entries[:self.top_k]
 
@@ -203,7 +221,11 @@ def create_pipelines_from_config(
     Returns:
         List of configured PersonaPipeline instances
     """
-    pipelines = []
+    pipelines: List[PersonaPipeline] = []
+
+    # One hash set shared by every pipeline, so overlapping sources are only
+    # evaluated by the first persona to reach them
+    seen_hashes: Set[bytes] = set()
 
     for config in pipelines_config:
         if not config.enabled:
@@ -215,6 +237,7 @@ def create_pipelines_from_config(
                 pipeline_config=config,
                 llm=llm,
                 tracker=tracker,
+                seen_hashes=seen_hashes,
             )
             pipelines.append(pipeline)
             logger.info(f"Created pipeline: {config.name}")
@@ -222,3 +245,29 @@ def create_pipelines_from_config(
             logger.error(f"Failed to create pipeline '{config.name}': {e}")
 
     return pipelines
+
+
+async def run_all(pipelines: List[PersonaPipeline]) -> List[List[DigestEntry]]:
+    """
+    Run all pipelines concurrently.
+
+    Pipelines are dominated by source fetches and LLM calls, so running them
+    together takes roughly the time of the slowest one rather than the sum.
+    A failed pipeline contributes an empty list instead of aborting the rest.
+
+    Returns:
+        One list of digest entries per pipeline, in input order.
+    """
+    results = await asyncio.gather(
+        *(pipeline.run() for pipeline in pipelines),
+        return_exceptions=True,
+    )
+
+    entries_per_pipeline: List[List[DigestEntry]] = []
+    for pipeline, result in zip(pipelines, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Pipeline failed: {pipeline.name}: {result}")
+            entries_per_pipeline.append([])
+        else:
+            entries_per_pipeline.append(result)
+    return entries_per_pipeline